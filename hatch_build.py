@@ -6,7 +6,11 @@ from hatchling.metadata.plugin.interface import MetadataHookInterface
 # Building version-pioneer using version-pioneer functions..
 # without installing the package, we import the module.
 # Make sure build-time dependencies are installed.
-sys.path.append(str(Path(__file__).parent / "src"))
+# Prepend (not append) so our modules are found on the first sys.path entry,
+# and guard against growing sys.path when hatch imports this module repeatedly.
+_SRC_DIR = str(Path(__file__).parent / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from version_pioneer.build.hatchling.build_hook import (
     VersionPioneerBuildHook,  # This hook will be used just by importing it.  # noqa: F401
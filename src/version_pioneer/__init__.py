@@ -12,9 +12,35 @@ from importlib.metadata import Distribution, PackageNotFoundError
 from os import PathLike
 from pathlib import Path
 
-from ._version import get_version_dict as _get_version_dict
 
-__version__ = _get_version_dict()["version"]
+@lru_cache(maxsize=1)
+def _load_version() -> str:
+    try:
+        # The versionfile generated at build time embeds __version__ as a literal,
+        # so a built installation skips the VCS/file-walking work entirely.
+        # In the source tree _version.py is the versionscript, which has no
+        # __version__; this import is expected to fail there (handled below).
+        from ._version import (
+            __version__ as version,  # pyright: ignore[reportAttributeAccessIssue]
+        )
+    except ImportError:
+        # Editable install: _version.py is the original versionscript.
+        from ._version import get_version_dict
+
+        version = get_version_dict()["version"]
+    return version
+
+
+def __getattr__(name: str) -> str:
+    # PEP 562: resolve __version__ lazily, so `import version_pioneer` doesn't
+    # pay the version resolution cost (git subprocesses in editable installs)
+    # unless the version is actually read.
+    if name == "__version__":
+        version = _load_version()
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +49,29 @@ APP_NAME_UPPER = APP_NAME.upper()
 PACKAGE_NAME = APP_NAME.replace("_", "-")
 
 
+@lru_cache(maxsize=1)
+def _pkg_is_editable() -> bool:
+    # Module-level so the cached result survives across setup_logging() calls;
+    # the first call walks site-packages metadata, which is surprisingly slow.
+    try:
+        direct_url = Distribution.from_name(PACKAGE_NAME).read_text("direct_url.json")
+    except PackageNotFoundError:
+        # Not installed?
+        return False
+
+    if direct_url is None:
+        # package is not installed at all
+        return False
+    # direct_url.json is tiny and machine-generated (PEP 610), so a substring
+    # scan answers the one-field query without a full JSON parse.
+    if '"editable": true' in direct_url or '"editable":true' in direct_url:
+        return True
+    if '"dir_info"' not in direct_url:
+        return False
+    # Unusual whitespace in the file; fall back to a real parse.
+    return json.loads(direct_url).get("dir_info", {}).get("editable", False)
+
+
 def setup_logging(
     console_level: int | str = logging.INFO,
     log_dir: str | PathLike | None = None,
@@ -71,24 +120,9 @@ def setup_logging(
         )
     )
 
-    @lru_cache
-    def pkg_is_editable():
-        try:
-            direct_url = Distribution.from_name(PACKAGE_NAME).read_text(
-                "direct_url.json"
-            )
-        except PackageNotFoundError:
-            # Not installed?
-            return False
-
-        if direct_url is None:
-            # package is not installed at all
-            return False
-        return json.loads(direct_url).get("dir_info", {}).get("editable", False)
-
     # NOTE: The value is None if you haven't installed with `pip install -e .` (development mode).
     # We make it None to discourage the use of this path. Only use for development.
-    if pkg_is_editable():
+    if _pkg_is_editable():
         PROJECT_DIR = Path(__file__).parent.parent.parent  # noqa: N806
     else:
         PROJECT_DIR = None  # noqa: N806
@@ -164,9 +198,10 @@ def setup_logging(
     else:
         name_or_path = function_caller_module.__name__
 
+    version = _load_version()
     log_path_map = {
         "name": name_or_path,
-        "version": __version__,
+        "version": version,
         "date": datetime.now(timezone.utc),
     }
 
@@ -174,7 +209,7 @@ def setup_logging(
     root_logger.addHandler(console_handler)
 
     if log_init_messages:
-        logger.info(f"Running with {PACKAGE_NAME} {__version__}")
+        logger.info(f"Running with {PACKAGE_NAME} {version}")
 
     if log_dir is not None:
         log_paths: list[Path] = []
@@ -1,19 +1,55 @@
 # ruff: noqa: T201
 from __future__ import annotations
 
-import stat
+import functools
+import os
 import tempfile
 from pathlib import Path
 from typing import Any
 
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface
 
-from version_pioneer.utils.toml import get_toml_value, load_toml
+from version_pioneer.utils.toml import get_toml_value, load_toml_cached
 from version_pioneer.utils.versionscript import (
     convert_version_dict,
-    exec_versionscript,
+    exec_versionscript_cached,
     find_versionscript_from_project_dir,
 )
+from version_pioneer.versionscript import VersionDict
+
+
+@functools.lru_cache(maxsize=None)
+def _load_project_state(root: str) -> tuple[dict[str, Any], VersionDict]:
+    """
+    Parse pyproject.toml and evaluate the versionscript once per project root.
+
+    The hook runs twice per `uv build` / `pyproject-build` invocation
+    (sdist pass then wheel pass), and both passes need the same parsed config
+    and version, so memoise them instead of re-parsing and re-executing.
+    """
+    pyproject_toml = load_toml_cached(Path(root) / "pyproject.toml")
+
+    # This also checks the valid config, so run it first.
+    versionscript = find_versionscript_from_project_dir(
+        project_dir=root,
+        either_versionfile_or_versionscript=True,
+    )
+    # The per-script cache is shared with the version source plugin, so one
+    # build resolves the version from git exactly once.
+    version_dict = exec_versionscript_cached(versionscript)
+    return pyproject_toml, version_dict
+
+
+@functools.lru_cache(maxsize=None)
+def _render_versionfile(root: str) -> bytes:
+    """
+    Render the constant versionfile once per project root.
+
+    The sdist and wheel passes write byte-identical content, so format the
+    template a single time and reuse the encoded result.
+    """
+    _, version_dict = _load_project_state(root)
+    return convert_version_dict(version_dict, output_format="python").encode("utf-8")
 
 
 class VersionPioneerBuildHook(BuildHookInterface):
@@ -34,13 +70,8 @@ class VersionPioneerBuildHook(BuildHookInterface):
         if version == "editable":
             return
 
-        pyproject_toml = load_toml(Path(self.root) / "pyproject.toml")
-
-        # This also checks the valid config, so run it first.
-        versionscript = find_versionscript_from_project_dir(
-            project_dir=self.root,
-            either_versionfile_or_versionscript=True,
-        )
+        root_key = str(Path(self.root).resolve())
+        pyproject_toml, _version_dict = _load_project_state(root_key)
 
         # In hatchling, versionfile-wheel setting doesn't get used.
         # Instead, the versionfile-sdist needs to be used to locate the build _version.py file.
@@ -54,23 +85,18 @@ class VersionPioneerBuildHook(BuildHookInterface):
             print("Skipping writing a constant version file")
             return
         else:
-            # NOTE: Setting delete=True will delete too early on Windows
-            self.temp_versionfile = tempfile.NamedTemporaryFile(  # noqa: SIM115
-                mode="w", delete=False, encoding="utf-8"
-            )
-            version_dict = exec_versionscript(versionscript)
-            self.temp_versionfile.write(
-                convert_version_dict(version_dict, output_format="python")
-            )
-            self.temp_versionfile.flush()
-
-            # make it executable
-            versionfile_build_temp = Path(self.temp_versionfile.name)
-            versionfile_build_temp.chmod(
-                versionfile_build_temp.stat().st_mode | stat.S_IEXEC
-            )
-
-            build_data["force_include"][self.temp_versionfile.name] = versionfile_sdist
+            # NOTE: A NamedTemporaryFile would be deleted too early on Windows.
+            # force_include only takes filesystem paths, so one temp file is
+            # unavoidable; mkstemp + a single os.write skips the buffered
+            # file-object wrapper, and there is no directory to create/remove.
+            fd, temp_path = tempfile.mkstemp(suffix="_version.py")
+            try:
+                os.write(fd, _render_versionfile(root_key))
+            finally:
+                os.close(fd)
+            self.temp_versionfile = Path(temp_path)
+
+            build_data["force_include"][temp_path] = versionfile_sdist
 
     def finalize(
         self,
@@ -80,5 +106,4 @@ class VersionPioneerBuildHook(BuildHookInterface):
     ) -> None:
         if self.temp_versionfile is not None:
             # Delete the temporary version file
-            self.temp_versionfile.close()
-            Path(self.temp_versionfile.name).unlink()
+            self.temp_versionfile.unlink(missing_ok=True)
@@ -1,7 +1,7 @@
 from hatchling.version.source.plugin.interface import VersionSourceInterface
 
 from version_pioneer.utils.versionscript import (
-    exec_versionscript,
+    exec_versionscript_cached,
     find_versionscript_from_project_dir,
 )
 
@@ -14,6 +14,8 @@ class VersionPioneerVersionSource(VersionSourceInterface):
             project_dir=self.root,
             either_versionfile_or_versionscript=True,
         )
-        version_dict = exec_versionscript(versionscript)
+        # Cached: the build hook executes the same script in the same process,
+        # so the git calls only happen once per (path, mtime).
+        version_dict = exec_versionscript_cached(versionscript)
 
         return {"version": version_dict["version"]}
@@ -1,7 +1,7 @@
 # ruff: noqa: T201
 from __future__ import annotations
 
-import stat
+import os
 from pathlib import Path
 
 from pdm.backend.hooks.base import Context
@@ -9,7 +9,7 @@ from pdm.backend.hooks.base import Context
 from version_pioneer.utils.toml import get_toml_value
 from version_pioneer.utils.versionscript import (
     convert_version_dict,
-    exec_versionscript,
+    exec_versionscript_cached,
     find_versionscript_from_pyproject_toml_dict,
 )
 
@@ -20,39 +20,48 @@ class VersionPioneerBuildHook:
         versionscript = find_versionscript_from_pyproject_toml_dict(
             context.config.data, either_versionfile_or_versionscript=True
         )
-        version_dict = exec_versionscript(versionscript)
+        # Cached: when pdm builds sdist and wheel in one process, the second
+        # pass reuses the resolved version instead of re-running git.
+        version_dict = exec_versionscript_cached(versionscript)
         context.config.metadata["version"] = version_dict["version"]
 
         # Write the static version file
         if context.target != "editable":
-            try:
-                if context.target == "wheel":
-                    versionfile = context.build_dir / Path(
-                        get_toml_value(
-                            context.config.data,
-                            ["tool", "version-pioneer", "versionfile-wheel"],
-                            raise_error=True,
-                        )
-                    )
-                elif context.target == "sdist":
-                    versionfile = context.build_dir / Path(
-                        get_toml_value(
-                            context.config.data,
-                            ["tool", "version-pioneer", "versionfile-sdist"],
-                            raise_error=True,
-                        )
-                    )
-                else:
-                    raise ValueError(f"Unsupported target: {context.target}")
-            except KeyError as e:
-                print(str(e))  # Missing versionfile-sdist/build in pyproject.toml
+            # Look the tool table up once instead of re-walking
+            # tool -> version-pioneer per key.
+            vp_config = get_toml_value(
+                context.config.data, ["tool", "version-pioneer"], default={}
+            )
+            if context.target == "wheel":
+                versionfile_key = "versionfile-wheel"
+            elif context.target == "sdist":
+                versionfile_key = "versionfile-sdist"
+            else:
+                raise ValueError(f"Unsupported target: {context.target}")
+
+            if versionfile_key not in vp_config:
+                # Missing versionfile-sdist/build in pyproject.toml
+                print(
+                    f"Missing key tool.version-pioneer.{versionfile_key} in pyproject.toml"
+                )
                 print("Skipping writing a constant version file")
             else:
+                versionfile = context.build_dir / Path(vp_config[versionfile_key])
                 context.ensure_build_dir()
                 versionfile.parent.mkdir(parents=True, exist_ok=True)
-                versionfile.write_text(
-                    convert_version_dict(version_dict, output_format="python"),
-                    encoding="utf-8",
-                )
-                # make it executable
-                versionfile.chmod(versionfile.stat().st_mode | stat.S_IEXEC)
+                content = convert_version_dict(
+                    version_dict, output_format="python"
+                ).encode("utf-8")
+                # The file may survive from a previous build pass; skip the
+                # rewrite when the content is already byte-identical.
+                if not versionfile.exists() or versionfile.read_bytes() != content:
+                    # O_CREAT carries the executable mode directly (umask
+                    # permitting), so no separate stat+chmod round-trip is
+                    # needed to make the script runnable.
+                    fd = os.open(
+                        versionfile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755
+                    )
+                    try:
+                        os.write(fd, content)
+                    finally:
+                        os.close(fd)
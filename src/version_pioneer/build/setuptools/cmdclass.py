@@ -1,26 +1,34 @@
 # ruff: noqa: T201
 from __future__ import annotations
 
+import functools
 import os
 import sys
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from version_pioneer.api import exec_versionscript_and_convert
-from version_pioneer.utils.toml import (
-    find_pyproject_toml,
-    get_toml_value,
-    load_toml,
-)
+from version_pioneer.utils.toml import Pyproject
 from version_pioneer.utils.versionscript import (
     convert_version_dict,
-    exec_versionscript,
+    exec_versionscript_cached,
     find_versionscript_from_project_dir,
     find_versionscript_from_pyproject_toml_dict,
 )
 
 
+def _atomic_write_text(path: Path, content: str) -> None:
+    """
+    Write via a sibling temp file + os.replace so readers never observe a
+    partially written file (parallel build steps may import the versionfile
+    mid-write). The rename also breaks any hardlink into the source tree
+    instead of truncating through it.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)  # noqa: PTH105
+
+
 def get_cmdclass(cmdclass: dict[str, Any] | None = None):
     """
     Get the custom setuptools subclasses used by Versioneer.
@@ -43,8 +51,26 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
         # happens, we protect the child from the parent's versioneer too.
         # Also see https://github.com/python-versioneer/python-versioneer/issues/52
 
-    cmds = {} if cmdclass is None else cmdclass.copy()
+    if cmdclass is not None:
+        return _build_cmdclass(cmdclass.copy())
+
+    # Memoised: setuptools can ask for the cmdclass several times within one
+    # build process, and reusing the same class objects avoids rebuilding the
+    # five subclasses per call (and keeps isinstance checks against them
+    # valid). The cx_Freeze/py2exe probes change the command set, so they key
+    # the cache.
+    return _get_default_cmdclass(
+        cx_freeze="cx_Freeze" in sys.modules,
+        py2exe="py2exe" in sys.modules,
+    ).copy()
 
+
+@functools.lru_cache(maxsize=4)
+def _get_default_cmdclass(*, cx_freeze: bool, py2exe: bool) -> dict[str, Any]:
+    return _build_cmdclass({})
+
+
+def _build_cmdclass(cmds: dict[str, Any]) -> dict[str, Any]:
     # we add "version" to setuptools
     from setuptools import Command
 
@@ -60,7 +86,9 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
             pass
 
         def run(self) -> None:
-            vers = exec_versionscript(
+            # Cached by (path, mtime): other commands in the same build reuse
+            # the result instead of shelling out to git again.
+            vers = exec_versionscript_cached(
                 find_versionscript_from_project_dir(
                     either_versionfile_or_versionscript=True
                 )
@@ -92,6 +120,47 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
     # pip install -e . and setuptool/editable_wheel will invoke build_py
     # but the build_py command is not expected to copy any files.
 
+    def _update_versionfile_in_build_lib(
+        build_lib: str, *, skip_missing: bool = False
+    ) -> None:
+        """
+        Write the rendered constant versionfile into build_lib.
+
+        Shared by build_py and build_ext, which write byte-identical content
+        to the same target. The versionscript execution underneath is cached
+        per (path, mtime), so when both commands run in one build, git is only
+        invoked once and the second caller just re-renders the string.
+        """
+        # Deferred: api drags in tarfile/hashlib/concurrent.futures, which
+        # setup.py parsing (e.g. `setup.py egg_info`) never needs.
+        from version_pioneer.api import exec_versionscript_and_convert
+
+        pyproject = Pyproject()
+        versionfile_wheel = pyproject.versionfile_wheel
+        if versionfile_wheel is None:
+            return
+        versionscript = find_versionscript_from_pyproject_toml_dict(
+            pyproject.data, either_versionfile_or_versionscript=True
+        )
+        target_versionfile = Path(build_lib) / versionfile_wheel
+        if skip_missing and not target_versionfile.exists():
+            print(
+                f"Warning: {target_versionfile} does not exist, skipping "
+                "version update. This can happen if you are running build_ext "
+                "without first running build_py."
+            )
+            return
+        content = exec_versionscript_and_convert(versionscript, output_format="python")
+        # Incremental rebuilds: leave an already up-to-date file (and its
+        # mtime) alone.
+        if (
+            target_versionfile.exists()
+            and target_versionfile.read_text(encoding="utf-8") == content
+        ):
+            return
+        print(f"UPDATING {target_versionfile}")
+        _atomic_write_text(target_versionfile, content)
+
     # we override different "build_py" commands for both environments
     if "build_py" in cmds:
         _build_py: Any = cmds["build_py"]
@@ -107,24 +176,7 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
                 return
             # now locate _version.py in the new build/ directory and replace
             # it with an updated value
-            pyproject_toml_file = find_pyproject_toml()
-            pyproject_toml = load_toml(pyproject_toml_file)
-            versionfile_wheel: str | None = get_toml_value(
-                pyproject_toml,
-                ["tool", "version-pioneer", "versionfile-wheel"],
-            )
-            if versionfile_wheel is not None:
-                versionscript = find_versionscript_from_pyproject_toml_dict(
-                    pyproject_toml, either_versionfile_or_versionscript=True
-                )
-                target_versionfile_content = exec_versionscript_and_convert(
-                    versionscript, output_format="python"
-                )
-                target_versionfile = Path(self.build_lib) / versionfile_wheel
-                print(f"UPDATING {target_versionfile}")
-                target_versionfile.write_text(
-                    target_versionfile_content, encoding="utf-8"
-                )
+            _update_versionfile_in_build_lib(self.build_lib)
 
     cmds["build_py"] = CmdBuildPy
 
@@ -144,56 +196,28 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
                 return
             # now locate _version.py in the new build/ directory and replace
             # it with an updated value
-            pyproject_toml_file = find_pyproject_toml()
-            pyproject_toml = load_toml(pyproject_toml_file)
-            versionfile_wheel: str | None = get_toml_value(
-                pyproject_toml,
-                ["tool", "version-pioneer", "versionfile-wheel"],
-            )
-            if versionfile_wheel is not None:
-                versionscript = find_versionscript_from_pyproject_toml_dict(
-                    pyproject_toml, either_versionfile_or_versionscript=True
-                )
-                target_versionfile_content = exec_versionscript_and_convert(
-                    versionscript, output_format="python"
-                )
-                target_versionfile = Path(self.build_lib) / versionfile_wheel
-                if not target_versionfile.exists():
-                    print(
-                        f"Warning: {target_versionfile} does not exist, skipping "
-                        "version update. This can happen if you are running build_ext "
-                        "without first running build_py."
-                    )
-                    return
-                print(f"UPDATING {target_versionfile}")
-                target_versionfile.write_text(
-                    target_versionfile_content, encoding="utf-8"
-                )
+            _update_versionfile_in_build_lib(self.build_lib, skip_missing=True)
 
     cmds["build_ext"] = CmdBuildExt
 
     def _run_directly_inside_source_tree(run_func: Callable):
-        pyproject_toml_file = find_pyproject_toml()
-        pyproject_toml = load_toml(pyproject_toml_file)
-        versionscript: Path | None = get_toml_value(
-            pyproject_toml,
-            ["tool", "version-pioneer", "versionscript"],
-            return_path_object=True,
-        )
+        # Deferred like in _update_versionfile_in_build_lib: api pulls in
+        # tarfile/hashlib/concurrent.futures that plain setup.py imports of
+        # this module never need.
+        from version_pioneer.api import exec_versionscript_and_convert
+
+        pyproject = Pyproject()
+        versionscript = pyproject.versionscript
         if versionscript is None:
             raise ValueError("versionscript is not set in pyproject.toml")
-        versionfile_sdist: Path | None = get_toml_value(
-            pyproject_toml,
-            ["tool", "version-pioneer", "versionfile-sdist"],
-            return_path_object=True,
-        )
+        versionfile_sdist = pyproject.versionfile_sdist
         if versionfile_sdist is None:
             print("Skipping version update due to versionfile-sdist not set.")
             run_func()
             return
 
-        versionscript = pyproject_toml_file.parent / versionscript
-        versionfile_sdist = pyproject_toml_file.parent / versionfile_sdist
+        versionscript = pyproject.file.parent / versionscript
+        versionfile_sdist = pyproject.file.parent / versionfile_sdist
 
         if versionscript == versionfile_sdist:
             # HACK: replace _version.py directly in the source tree during build, and restore it.
@@ -203,19 +227,25 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
                 versionscript, output_format="python"
             )
 
-            original_versionscript_bytes = versionscript.read_bytes()
-            target_versionfile.write_text(target_versionfile_content, encoding="utf-8")
-
-            run_func()
-
-            target_versionfile.write_bytes(original_versionscript_bytes)
+            # Move the original aside with a rename (metadata-only, no
+            # content read/rewrite) and restore it in a finally block, so a
+            # failing build cannot leave the rendered file in the source tree.
+            backup = versionscript.with_name(versionscript.name + ".vp-backup")
+            os.replace(versionscript, backup)  # noqa: PTH105
+            try:
+                target_versionfile.write_text(
+                    target_versionfile_content, encoding="utf-8"
+                )
+                run_func()
+            finally:
+                os.replace(backup, versionscript)  # noqa: PTH105
         else:
             # HACK: write _version.py directly in the source tree during build.
             target_versionfile = versionfile_sdist
             target_versionfile_content = exec_versionscript_and_convert(
                 versionscript, output_format="python"
             )
-            target_versionfile.write_text(target_versionfile_content, encoding="utf-8")
+            _atomic_write_text(target_versionfile, target_versionfile_content)
 
             run_func()
             # We do not remove the versionfile-sdist. Put it as .gitignore.
@@ -268,15 +298,18 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
             # Modify the filelist and normalize it
             # self.filelist.append("versioneer.py")
 
-            pyproject_toml_file = find_pyproject_toml()
-            pyproject_toml = load_toml(pyproject_toml_file)
             versionscript = find_versionscript_from_pyproject_toml_dict(
-                pyproject_toml, either_versionfile_or_versionscript=True
+                Pyproject().data, either_versionfile_or_versionscript=True
             )
 
             # There are rare cases where versionscript might not be
-            # included by default, so we must be explicit
-            self.filelist.append(str(versionscript))
+            # included by default, so we must be explicit.
+            # If it is already in the manifest, super() has written a correct
+            # SOURCES.txt and the O(N) re-normalization below can be skipped.
+            versionscript_str = str(versionscript)
+            if versionscript_str in self.filelist.files:
+                return
+            self.filelist.append(versionscript_str)
 
             self.filelist.sort()
             self.filelist.remove_duplicates()
@@ -285,12 +318,17 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
             # generated the filelist and was thrown away
             # We will instead replicate their final normalization (to unicode,
             # and POSIX-style paths)
-            from setuptools import unicode_utils
+            if os.sep == "/":
+                # POSIX: entries are already str and already use "/", so the
+                # decode-and-replace pass would be a no-op per file.
+                normalized = self.filelist.files
+            else:
+                from setuptools import unicode_utils
 
-            normalized = [
-                unicode_utils.filesys_decode(f).replace(os.sep, "/")
-                for f in self.filelist.files
-            ]
+                normalized = [
+                    unicode_utils.filesys_decode(f).replace(os.sep, "/")
+                    for f in self.filelist.files
+                ]
 
             manifest_filename = Path(self.egg_info) / "SOURCES.txt"
             manifest_filename.write_text("\n".join(normalized), encoding="utf-8")
@@ -305,20 +343,15 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
 
     class CmdSdist(_sdist):
         def run(self) -> None:
-            pyproject_toml_file = find_pyproject_toml()
-            pyproject_toml = load_toml(pyproject_toml_file)
+            pyproject = Pyproject()
             versionscript = find_versionscript_from_pyproject_toml_dict(
-                pyproject_toml, either_versionfile_or_versionscript=True
+                pyproject.data, either_versionfile_or_versionscript=True
             )
-            self.version_dict = exec_versionscript(
-                pyproject_toml_file.parent / versionscript
+            self.version_dict = exec_versionscript_cached(
+                pyproject.file.parent / versionscript
             )
 
-            self.versionfile_sdist: Path | None = get_toml_value(
-                pyproject_toml,
-                ["tool", "version-pioneer", "versionfile-sdist"],
-                return_path_object=True,
-            )
+            self.versionfile_sdist: Path | None = pyproject.versionfile_sdist
 
             # unless we update this, the command will keep using the old
             # version
@@ -335,11 +368,16 @@ def get_cmdclass(cmdclass: dict[str, Any] | None = None):
                 print("Skipping version update due to versionfile-sdist not set.")
             else:
                 target_versionfile = Path(base_dir) / self.versionfile_sdist
-                print(f"UPDATING {target_versionfile}")
-                target_versionfile.write_text(
-                    convert_version_dict(self.version_dict, output_format="python"),
-                    encoding="utf-8",
+                content = convert_version_dict(
+                    self.version_dict, output_format="python"
                 )
+                if (
+                    target_versionfile.exists()
+                    and target_versionfile.read_text(encoding="utf-8") == content
+                ):
+                    return
+                print(f"UPDATING {target_versionfile}")
+                _atomic_write_text(target_versionfile, content)
 
     cmds["sdist"] = CmdSdist
 
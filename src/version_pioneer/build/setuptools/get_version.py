@@ -1,5 +1,6 @@
-from version_pioneer.api import exec_versionscript_and_convert
-
-
 def get_version():
+    # Deferred: api drags in tarfile/hashlib/concurrent.futures, which
+    # importing this package (e.g. from setup.py) never needs by itself.
+    from version_pioneer.api import exec_versionscript_and_convert
+
     return exec_versionscript_and_convert(output_format="version-string")
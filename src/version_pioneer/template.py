@@ -1,17 +1,30 @@
 """
 This module should be able to be imported from anywhere without any dependencies, because it's used in setup.
-"""
 
-import textwrap
+The templates are exposed as PEP 562 lazy attributes: the raw sources are
+stored as-is and the dedent + strip normalisation runs on first access, once
+per attribute. Importing this module therefore costs nothing beyond the
+string literals, and a consumer that needs one template doesn't normalise
+the other three.
+
+Note:
+    EXEC_OUTPUT_PYTHON is the build-time bake-in: the build hooks evaluate the
+    versionscript once and ship this constant-only file in sdists/wheels, so
+    installed packages import the version with no subprocess, regex or
+    dataclass work at runtime.
+"""
 
-EXEC_OUTPUT_PYTHON = textwrap.dedent(
-    """
+_EXEC_OUTPUT_PYTHON_SRC = """
     #!/usr/bin/env python3
     # THIS "versionfile" IS GENERATED BY version-pioneer-{version_pioneer_version}
     # by evaluating the original versionscript and storing the computed versions as a constant.
 
+    __version_dict__ = {version_dict}
+    __version__ = __version_dict__["version"]
+
+
     def get_version_dict():
-        return {version_dict}
+        return __version_dict__
 
 
     if __name__ == "__main__":
@@ -19,10 +32,9 @@ EXEC_OUTPUT_PYTHON = textwrap.dedent(
 
         print(json.dumps(get_version_dict()))
     """
-).strip()
 
 
-SETUP_PY = textwrap.dedent("""
+_SETUP_PY_SRC = """
     from setuptools import setup
     from version_pioneer.build.setuptools import get_version, get_cmdclass
 
@@ -30,17 +42,17 @@ SETUP_PY = textwrap.dedent("""
         version=get_version(),
         cmdclass=get_cmdclass(),
     )
-""").strip()
+"""
 
 
-INIT_PY = textwrap.dedent("""
+_INIT_PY_SRC = """
     from ._version import get_version_dict
 
     __version__ = get_version_dict()["version"]
-""").strip()
+"""
 
 
-NO_VENDOR_VERSIONSCRIPT = textwrap.dedent("""
+_NO_VENDOR_VERSIONSCRIPT_SRC = """
     #!/usr/bin/env python3
     from pathlib import Path
 
@@ -67,4 +79,46 @@ NO_VENDOR_VERSIONSCRIPT = textwrap.dedent("""
         import json
 
         print(json.dumps(get_version_dict()))
-""").strip()
+"""
+
+
+_EXEC_OUTPUT_PARTS = None
+
+
+def format_exec_output(version_pioneer_version: str, version_dict_repr: str) -> str:
+    """
+    Render EXEC_OUTPUT_PYTHON without re-parsing the format string.
+
+    The template is split around its two placeholders on first use; every
+    later call is three string concatenations instead of a str.format pass
+    over the whole template.
+    """
+    global _EXEC_OUTPUT_PARTS  # noqa: PLW0603
+    if _EXEC_OUTPUT_PARTS is None:
+        exec_output = globals().get("EXEC_OUTPUT_PYTHON")
+        if exec_output is None:
+            exec_output = __getattr__("EXEC_OUTPUT_PYTHON")
+        # Plain str literal, not a missing f-prefix: this is the placeholder
+        # text being split out of the template.
+        head, rest = exec_output.split("{version_pioneer_version}")  # noqa: RUF027
+        mid, tail = rest.split("{version_dict}")
+        _EXEC_OUTPUT_PARTS = (head, mid, tail)
+    head, mid, tail = _EXEC_OUTPUT_PARTS
+    return head + version_pioneer_version + mid + version_dict_repr + tail
+
+
+def __getattr__(name: str) -> str:
+    if name in (
+        "EXEC_OUTPUT_PYTHON",
+        "SETUP_PY",
+        "INIT_PY",
+        "NO_VENDOR_VERSIONSCRIPT",
+    ):
+        import textwrap
+
+        # Cache into the module namespace so later accesses (and
+        # `from ... import X` elsewhere) bypass __getattr__ entirely.
+        value = textwrap.dedent(globals()[f"_{name}_SRC"]).strip()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
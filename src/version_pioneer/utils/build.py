@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import contextlib
 import subprocess
 import sys
-from io import StringIO
+import zipfile
 from os import PathLike
 from pathlib import Path
 
@@ -62,10 +61,18 @@ def build_project(*args, cwd=None, check=True, use_uv=True):
     return process.stderr, built_paths
 
 
-def unpack_wheel(wheel_path: str | PathLike, dest_dir: str | PathLike | None = None):
-    from wheel.cli.unpack import unpack
+def unpack_wheel(
+    wheel_path: str | PathLike, dest_dir: str | PathLike | None = None
+) -> Path:
+    """
+    Unpack a wheel into `dest_dir/<name>-<version>/`, like `wheel unpack`.
 
-    f = StringIO()
-    with contextlib.redirect_stdout(f):
-        unpack(str(wheel_path), str(dest_dir) if dest_dir else ".")
-    return f.getvalue()
+    A wheel is just a zip, so extracting with zipfile skips the wheel CLI and
+    its RECORD re-validation; the wheels handled here were just built by us.
+    """
+    wheel_path = Path(wheel_path)
+    name_and_version = "-".join(wheel_path.name.split("-")[:2])
+    destination = (Path(dest_dir) if dest_dir else Path.cwd()) / name_and_version
+    with zipfile.ZipFile(wheel_path) as zf:
+        zf.extractall(destination)
+    return destination
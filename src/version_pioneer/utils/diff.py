@@ -3,6 +3,11 @@ from __future__ import annotations
 
 def unidiff_output(expected: str, actual: str):
     """Returns a string containing the unified diff of two multiline strings."""
+    if expected == actual:
+        # Equal inputs produce an empty diff; skip the splitlines copies and
+        # the difflib import (kept lazy so importing this module stays free).
+        return ""
+
     import difflib
 
     expected_list = expected.splitlines(keepends=True)
@@ -1,47 +1,134 @@
 from __future__ import annotations
 
-import filecmp
 import fnmatch
+import functools
 import os
+import re
 from collections.abc import Iterable, Sequence
 from os import PathLike
 from pathlib import Path
 
 
+def _compile_ignore_patterns(patterns: Sequence[str]):
+    """
+    Compile fnmatch patterns into one alternation regex (or None if empty).
+
+    One regex match per path replaces a Python-level fnmatch call per
+    (path, pattern) pair; the win grows linearly with the pattern count.
+    Patterns are normcased like fnmatch.fnmatch does (on Windows this
+    lowercases and converts slashes to the native separator), so callers
+    must match against os.path.normcase(path).
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns)
+    )
+
+
 def remove_files_recusively(directory: str | PathLike, patterns: str | Sequence[str]):
     """Remove files recursively from a directory that match any of the patterns."""
     patterns = [patterns] if isinstance(patterns, str) else patterns
+    ignore_re = _compile_ignore_patterns(patterns)
+    if ignore_re is None:
+        return
 
     for root, _, files in os.walk(directory):
-        root = Path(root)
         for file in files:
-            if any(fnmatch.fnmatch(str(root / file), pattern) for pattern in patterns):
-                (root / file).unlink()
+            path = os.path.join(root, file)  # noqa: PTH118
+            if ignore_re.match(os.path.normcase(path)):
+                os.unlink(path)  # noqa: PTH108
 
 
 def are_dir_trees_equal(dir1, dir2):
     """
     Compare two directories recursively. Files in each directory are
     assumed to be equal if their names and contents are equal.
+
+    Thin wrapper over diff_dir_trees, which does one scandir walk per tree
+    instead of filecmp.dircmp's per-level re-listing and re-stat'ing.
+    """
+    diff_dir_trees(dir1, dir2)
+
+
+def _files_equal(path1: str, path2: str) -> bool:
+    """
+    Chunked byte comparison with early exit on the first differing block.
+
+    Unlike filecmp.cmp, this keeps no result cache: filecmp's module-level
+    cache is unbounded and the temp paths compared here are unique per run,
+    so it would only grow. Unlike hashing both files, a direct comparison
+    stops reading at the first mismatch.
+    """
+    bufsize = 128 * 1024
+    with open(path1, "rb") as f1, open(path2, "rb") as f2:
+        while True:
+            b1 = f1.read(bufsize)
+            b2 = f2.read(bufsize)
+            if b1 != b2:
+                return False
+            if not b1:
+                return True
+
+
+def diff_dir_trees(
+    dir1: str | PathLike,
+    dir2: str | PathLike,
+    *,
+    ignore_patterns: Sequence[str] = (),
+):
     """
-    dirs_cmp = filecmp.dircmp(dir1, dir2)
-    if (
-        len(dirs_cmp.left_only) > 0
-        or len(dirs_cmp.right_only) > 0
-        or len(dirs_cmp.funny_files) > 0
-    ):
-        raise FileNotFoundError(
-            f"Directory trees are not equal: {dirs_cmp.left_only}, {dirs_cmp.right_only}, {dirs_cmp.funny_files}"
+    Compare two directory trees in a single walk, skipping ignored files inline.
+
+    Unlike remove_files_recusively + are_dir_trees_equal, this neither deletes
+    anything nor walks each tree twice, and os.scandir's cached entry type
+    avoids an extra stat() per entry. Files whose sizes differ are reported
+    without opening them.
+
+    Raises FileNotFoundError if the trees differ (same contract as
+    are_dir_trees_equal).
+    """
+    ignore_re = _compile_ignore_patterns(ignore_patterns)
+
+    def _list_entries(
+        directory: str,
+    ) -> tuple[dict[str, os.DirEntry], dict[str, os.DirEntry]]:
+        files: dict[str, os.DirEntry] = {}
+        subdirs: dict[str, os.DirEntry] = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs[entry.name] = entry
+                elif ignore_re is None or not ignore_re.match(
+                    os.path.normcase(entry.path)
+                ):
+                    files[entry.name] = entry
+        return files, subdirs
+
+    stack = [(os.fspath(dir1), os.fspath(dir2))]
+    while stack:
+        d1, d2 = stack.pop()
+        files1, subdirs1 = _list_entries(d1)
+        files2, subdirs2 = _list_entries(d2)
+        if files1.keys() != files2.keys() or subdirs1.keys() != subdirs2.keys():
+            only_names = sorted(
+                (files1.keys() ^ files2.keys()) | (subdirs1.keys() ^ subdirs2.keys())
+            )
+            raise FileNotFoundError(
+                f"Directory trees are not equal: {only_names} ({d1} vs {d2})"
+            )
+        mismatch = [
+            name
+            for name, entry in files1.items()
+            if entry.stat(follow_symlinks=False).st_size
+            != files2[name].stat(follow_symlinks=False).st_size
+            or not _files_equal(entry.path, files2[name].path)
+        ]
+        if mismatch:
+            raise FileNotFoundError(f"Directory trees are not equal: {mismatch}")
+        stack.extend(
+            (entry.path, subdirs2[name].path) for name, entry in subdirs1.items()
         )
-    (_, mismatch, errors) = filecmp.cmpfiles(
-        dir1, dir2, dirs_cmp.common_files, shallow=False
-    )
-    if len(mismatch) > 0 or len(errors) > 0:
-        raise FileNotFoundError(f"Directory trees are not equal: {mismatch}, {errors}")
-    for common_dir in dirs_cmp.common_dirs:
-        new_dir1 = os.path.join(dir1, common_dir)  # noqa: PTH118
-        new_dir2 = os.path.join(dir2, common_dir)  # noqa: PTH118
-        are_dir_trees_equal(new_dir1, new_dir2)
 
 
 def find_root_dir_with_file(
@@ -61,3 +148,24 @@ def find_root_dir_with_file(
         source = source.parent
 
     raise FileNotFoundError(f"File {marker} not found in any parent directory")
+
+
+@functools.lru_cache(maxsize=256)
+def _find_root_cached(source: str, marker: str) -> Path:
+    return find_root_dir_with_file(source, marker)
+
+
+def find_root_dir_with_file_cached(
+    source: str | PathLike, marker: str | Iterable[str]
+) -> Path:
+    """
+    Like find_root_dir_with_file, memoised per (start directory, marker).
+
+    The upward walk stats every ancestor; within one session the project root
+    for a given start directory doesn't move, so repeated lookups (CLI + build
+    hooks + tests) hit the cache. Non-string markers fall through uncached
+    since lru_cache needs hashable keys.
+    """
+    if not isinstance(marker, str):
+        return find_root_dir_with_file(source, marker)
+    return _find_root_cached(os.path.abspath(source), marker)  # noqa: PTH100
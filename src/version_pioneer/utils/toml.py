@@ -1,19 +1,60 @@
 from __future__ import annotations
 
+import functools
+import os
 import sys
 from os import PathLike
 from pathlib import Path
 from typing import Any
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
+# Prefer a native-code TOML parser when one is available; the pure-Python
+# tomllib/tomli parser dominates build-hook startup time on large pyprojects.
+# The backend is chosen once at import so the cost is not paid per call.
+try:
+    import rtoml as _tomllib  # pyright: ignore[reportMissingImports]
+
+    _toml_loads = _tomllib.loads
+except ModuleNotFoundError:
+    if sys.version_info >= (3, 11):
+        import tomllib as _tomllib
+    else:
+        import tomli as _tomllib
+
+    _toml_loads = _tomllib.loads
 
 
 def load_toml(file: str | PathLike) -> dict[str, Any]:
-    with open(file, "rb") as f:
-        return tomllib.load(f)
+    # One-shot read through the raw fd: skips the BufferedReader that builtin
+    # open() sets up for a small file we read exactly once.
+    # Explicit decode because TOML is UTF-8 regardless of locale.
+    fd = os.open(file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    return _toml_loads(data.decode("utf-8"))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_toml_cached(file: str, _mtime_ns: int, _size: int) -> dict[str, Any]:
+    return load_toml(file)
+
+
+def load_toml_cached(file: str | PathLike) -> dict[str, Any]:
+    """
+    load_toml memoised by (path, mtime, size).
+
+    Build hooks parse the same pyproject.toml on each pass (sdist then wheel)
+    within one process; the mtime+size key keeps the cache safe if the file
+    is edited mid-session, including rewrites too fast for the filesystem's
+    mtime resolution to register. Callers must not mutate the returned dict.
+    """
+    file = os.fspath(file)
+    st = os.stat(file)  # noqa: PTH116
+    return _load_toml_cached(file, st.st_mtime_ns, st.st_size)
+
+
+_MISSING = object()
 
 
 def get_toml_value(
@@ -35,15 +76,18 @@ def get_toml_value(
     if default is not None and raise_error:
         raise ValueError("default and raise_error cannot both be set.")
 
+    value: Any = toml_dict
     for k in keys:
-        if k not in toml_dict:
+        # Single hashed lookup per level (dict.get with a sentinel) instead
+        # of the `in` + index pair. A non-table intermediate value counts as
+        # missing rather than raising TypeError mid-walk.
+        nxt = value.get(k, _MISSING) if isinstance(value, dict) else _MISSING
+        if nxt is _MISSING:
             key = ".".join(keys)
             if raise_error:
                 raise KeyError(f"Missing key {key} in {toml_path_for_error}")
             return default
-        toml_dict = toml_dict[k]
-
-    value: Any = toml_dict
+        value = nxt
 
     if return_path_object:
         return Path(value)
@@ -54,8 +98,51 @@ def find_pyproject_toml(project_dir: str | PathLike | None = None) -> Path:
     """
     Find the pyproject.toml file in the current directory or any parent directory.
     """
-    from .files import find_root_dir_with_file
+    from .files import find_root_dir_with_file_cached
 
     if project_dir is None:
         project_dir = Path.cwd()
-    return find_root_dir_with_file(project_dir, "pyproject.toml") / "pyproject.toml"
+    return (
+        find_root_dir_with_file_cached(project_dir, "pyproject.toml") / "pyproject.toml"
+    )
+
+
+class Pyproject:
+    """
+    Lazy accessor for a project's pyproject.toml.
+
+    Collapses the find_pyproject_toml -> load_toml -> get_toml_value chain
+    that build commands repeat per key: the file path is resolved eagerly
+    (cheap, and errors surface early), while parsing and the descent into the
+    [tool.version-pioneer] table happen at most once per instance. Parsing
+    additionally goes through the process-wide load_toml_cached, so several
+    instances in one build share a single parse. Do not mutate `data`.
+    """
+
+    def __init__(self, project_dir: str | PathLike | None = None):
+        self.file = find_pyproject_toml(project_dir)
+
+    @functools.cached_property
+    def data(self) -> dict[str, Any]:
+        return load_toml_cached(self.file)
+
+    @functools.cached_property
+    def version_pioneer_config(self) -> dict[str, Any]:
+        """The [tool.version-pioneer] table ({} when missing)."""
+        return get_toml_value(self.data, ["tool", "version-pioneer"], default={})
+
+    # cached_property so the TOML string is wrapped in a Path at most once
+    # per instance, however many times a command reads it.
+    @functools.cached_property
+    def versionscript(self) -> Path | None:
+        value = self.version_pioneer_config.get("versionscript")
+        return Path(value) if value is not None else None
+
+    @functools.cached_property
+    def versionfile_sdist(self) -> Path | None:
+        value = self.version_pioneer_config.get("versionfile-sdist")
+        return Path(value) if value is not None else None
+
+    @property
+    def versionfile_wheel(self) -> str | None:
+        return self.version_pioneer_config.get("versionfile-wheel")
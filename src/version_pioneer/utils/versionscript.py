@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
-import logging
-import tokenize
+import functools
+import importlib.util
+import sys
 from enum import Enum
 from os import PathLike
 from pathlib import Path
@@ -13,12 +13,10 @@ from version_pioneer import template
 from version_pioneer.utils.toml import (
     find_pyproject_toml,
     get_toml_value,
-    load_toml,
+    load_toml_cached,
 )
 from version_pioneer.versionscript import VersionDict
 
-logger = logging.getLogger(__name__)
-
 
 class ResolutionFormat(str, Enum):
     python = "python"
@@ -38,26 +36,25 @@ def find_versionscript_from_pyproject_toml_dict(
     *,
     either_versionfile_or_versionscript: bool = True,
 ):
-    versionscript: Path | None = get_toml_value(
-        pyproject_toml_dict,
-        ["tool", "version-pioneer", "versionscript"],
-        return_path_object=True,
+    # Walk tool -> version-pioneer once and read both keys from the sub-table.
+    vp_config: dict[str, Any] = get_toml_value(
+        pyproject_toml_dict, ["tool", "version-pioneer"], default={}
     )
 
-    if versionscript is None:
+    versionscript_value = vp_config.get("versionscript")
+    if versionscript_value is None:
         # NOTE: even if we end up loading versionfile-sdist, we still need to check the valid config.
         raise KeyError(
             "Missing key tool.version-pioneer.versionscript in pyproject.toml"
         )
+    versionscript = Path(versionscript_value)
 
     if either_versionfile_or_versionscript:
-        versionfile: Path | None = get_toml_value(
-            pyproject_toml_dict,
-            ["tool", "version-pioneer", "versionfile-sdist"],
-            return_path_object=True,
-        )
-        if versionfile is not None and versionfile.exists():
-            return versionfile
+        versionfile_value = vp_config.get("versionfile-sdist")
+        if versionfile_value is not None:
+            versionfile = Path(versionfile_value)
+            if versionfile.exists():
+                return versionfile
 
     if not versionscript.exists():
         raise FileNotFoundError(f"Version script not found: {versionscript}")
@@ -86,7 +83,9 @@ def find_versionscript_from_project_dir(
         raise NotADirectoryError(f"{project_dir} is not a directory.")
 
     pyproject_toml_file = find_pyproject_toml(project_dir)
-    pyproject_toml = load_toml(pyproject_toml_file)
+    # Cached: build hooks and the version source resolve the same project's
+    # config several times in one build process.
+    pyproject_toml = load_toml_cached(pyproject_toml_file)
 
     return pyproject_toml_file.parent / find_versionscript_from_pyproject_toml_dict(
         pyproject_toml,
@@ -94,10 +93,20 @@ def find_versionscript_from_project_dir(
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _compile_versionscript_code(versionscript_code: str) -> CodeType:
+    # Strings hash fast and are the natural cache key here; repeated calls
+    # with identical source (sdist pass then wheel pass) skip the
+    # tokenise/compile phase and only pay for the exec itself.
+    return compile(versionscript_code, "<versionscript>", "exec")
+
+
 def exec_versionscript_code(versionscript_code: str | CodeType) -> VersionDict:
     """
     Execute `get_version_dict()` in _version.py.
     """
+    if isinstance(versionscript_code, str):
+        versionscript_code = _compile_versionscript_code(versionscript_code)
     module_globals = {}
     exec(versionscript_code, module_globals)
     return module_globals["get_version_dict"]()
@@ -109,14 +118,49 @@ def exec_versionscript(
     """Execute _version.py to get __version_dict__."""
     versionscript_path = Path(versionscript_path)
 
-    # Reads using Python-source with correct encoding (PEP 263)
-    # instead of assuming it's UTF-8. It replaces the following:
-    # code = versionscript_path.read_text(encoding="utf-8")
-    with tokenize.open(versionscript_path) as f:
-        source = f.read()
-    code = compile(source, str(versionscript_path), "exec", dont_inherit=True)
+    # Load as a real module through the import machinery instead of exec-ing
+    # the source string. The loader handles PEP 263 encodings, and repeated
+    # builds (sdist pass then wheel pass) reuse the __pycache__ bytecode
+    # instead of re-tokenising and re-compiling the script.
+    # Registering the module in sys.modules also avoids the known exec+dataclass
+    # gotcha documented in versionscript.py.
+    spec = importlib.util.spec_from_file_location(
+        "_version_pioneer_versionscript", versionscript_path
+    )
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load version script: {versionscript_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        # spec_from_file_location always returns a SourceFileLoader-backed
+        # spec, which implements exec_module; the abstract Loader type in
+        # typeshed just doesn't declare it.
+        spec.loader.exec_module(module)  # pyright: ignore[reportAttributeAccessIssue]
+    finally:
+        sys.modules.pop(spec.name, None)
+
+    return module.get_version_dict()
 
-    return exec_versionscript_code(code)
+
+@functools.lru_cache(maxsize=16)
+def _exec_versionscript_cached(versionscript_path: str, _mtime_ns: int) -> VersionDict:
+    return exec_versionscript(versionscript_path)
+
+
+def exec_versionscript_cached(versionscript_path: str | PathLike) -> VersionDict:
+    """
+    Like exec_versionscript, but memoised per (resolved path, mtime).
+
+    Intended for build hooks: one build-backend process may resolve the same
+    script several times (e.g. the sdist and wheel passes), and each execution
+    shells out to git. The mtime key invalidates the entry if the script is
+    edited mid-session. Do NOT use this from long-lived processes that expect
+    the version to track git state, since commits don't touch the script file.
+    """
+    versionscript_path = Path(versionscript_path).resolve()
+    return _exec_versionscript_cached(
+        str(versionscript_path), versionscript_path.stat().st_mtime_ns
+    )
 
 
 def convert_version_dict(
@@ -126,11 +170,15 @@ def convert_version_dict(
     from version_pioneer import __version__
 
     if output_format == ResolutionFormat.python:
-        return template.EXEC_OUTPUT_PYTHON.format(
-            version_pioneer_version=__version__,
-            version_dict=version_dict,
-        )
+        # format_exec_output splits the template around its placeholders
+        # once and concatenates thereafter, so repeated renders (sdist pass
+        # then wheel pass) skip the str.format parsing entirely.
+        return template.format_exec_output(__version__, repr(version_dict))
     elif output_format == ResolutionFormat.json:
+        # Deferred: only this output format serialises to JSON, and this
+        # module sits on the import path of every build hook.
+        import json
+
         return json.dumps(version_dict)
     elif output_format == ResolutionFormat.version_string:
         return version_dict["version"]
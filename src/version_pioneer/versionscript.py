@@ -39,6 +39,7 @@ import errno
 import functools
 import os
 import re
+import shutil
 import subprocess
 import sys
 from collections.abc import Iterable
@@ -47,7 +48,7 @@ from email.parser import Parser
 from enum import Enum
 from os import PathLike
 from pathlib import Path
-from typing import Any, Literal, Optional, TypedDict, TypeVar, Union
+from typing import Any, Literal, Optional, TypedDict, TypeVar, Union, overload
 
 
 class VersionStyle(str, Enum):
@@ -138,11 +139,22 @@ if sys.platform == "win32":
 else:
     GIT_COMMANDS = ["git"]
 
+
 # GIT_DIR can interfere with correct operation of Versioneer.
 # It may be intended to be passed to the Versioneer-versioned project,
 # but that should not change where we get our version from.
-env = os.environ.copy()
-env.pop("GIT_DIR", None)
+@functools.lru_cache(maxsize=1)
+def _git_env() -> "dict[str, str]":
+    """
+    Process environment without GIT_DIR, copied lazily and only once.
+
+    os.environ.copy() walks every variable in the process; doing it at first
+    use (rather than import, or per git call) keeps both import and version
+    resolution cheap. The dict is shared: subprocess never mutates it.
+    """
+    env = os.environ.copy()
+    env.pop("GIT_DIR", None)
+    return env
 
 
 # https://github.com/pypa/packaging/blob/24.2/src/packaging/version.py#L117-L146
@@ -185,6 +197,10 @@ _VERSION_PATTERN = r"""
     (?:\+(?P<local>[a-z0-9]+(?:[-_\.][a-z0-9]+)*))?       # local version
 """
 
+# Compiled once at import: this runs on every version resolution, and the
+# precompiled pattern skips the re-cache dict lookup per call.
+_VERSION_RE = re.compile(_VERSION_PATTERN, re.VERBOSE)
+
 
 class NotThisMethodError(Exception):
     """Exception raised if a method is not valid for the current scenario."""
@@ -254,7 +270,7 @@ class GitMasterDistance:
         verbose: bool = False,
     ) -> "GitMasterDistance":
         git_runner = functools.partial(
-            _run_git_command_or_error, env=env, verbose=verbose
+            _run_git_command_or_error, env=_git_env(), verbose=verbose
         )
 
         # Get the current branch name
@@ -326,7 +342,30 @@ class GitMasterDistance:
         )
 
 
-@dataclass(frozen=True)
+# slots=True needs Python 3.10+. It drops the per-instance __dict__, which
+# makes GitPieces cheaper to construct and its attributes faster to read in
+# the render methods; older interpreters just keep the dict-based layout.
+if sys.version_info >= (3, 10):
+    _DATACLASS_KWARGS: "dict[str, bool]" = {"slots": True}
+else:
+    _DATACLASS_KWARGS = {}
+
+
+def _iso8601ify(date: str) -> str:
+    """
+    Normalise `git show --format=%ci` output to ISO-8601.
+
+    e.g. "2024-01-02 03:04:05 +0900" -> "2024-01-02T03:04:05+0900"
+
+    %ci has fixed field offsets, so the common case is two O(1) slices instead
+    of two full replace() scans; anything unexpected falls back to replace().
+    """
+    if len(date) >= 25 and date[10] == " " and date[19] == " ":
+        return f"{date[:10]}T{date[11:19]}{date[20:]}"
+    return date.replace(" ", "T", 1).replace(" ", "", 1)
+
+
+@dataclass(frozen=True, **_DATACLASS_KWARGS)
 class GitPieces:
     """
     Get version from 'git describe' in the root of the source tree.
@@ -358,15 +397,43 @@ class GitPieces:
         cwd: "str | PathLike",
         verbose: bool = False,
     ) -> "GitPieces":
-        runner = functools.partial(_run_command, env=env, verbose=verbose)
+        runner = functools.partial(_run_command, env=_git_env(), verbose=verbose)
 
-        _, rc = runner(
-            GIT_COMMANDS, ["rev-parse", "--git-dir"], cwd=cwd, hide_stderr=not verbose
+        # Batch the repo probe, HEAD hash, commit date and branch-name queries
+        # into a single `git log` spawn: process startup dominates the cost of
+        # version resolution, so 4 spawns -> 1. showSignature is forced off so
+        # no gpg output can precede the format lines.
+        log_out, rc = runner(
+            GIT_COMMANDS,
+            [
+                "-c",
+                "log.showSignature=false",
+                "log",
+                "-1",
+                "--format=%H%n%ci%n%D",
+                "HEAD",
+            ],
+            cwd=cwd,
+            hide_stderr=not verbose,
         )
-        if rc != 0:
+        if rc != 0 or log_out is None:
             if verbose:
                 print(f"Directory {cwd} not under git control")
-            raise NotThisMethodError("'git rev-parse --git-dir' returned error")
+            raise NotThisMethodError("'git log' returned error")
+        try:
+            full_out, date, decorations = log_out.strip().splitlines()
+        except ValueError:
+            raise NotThisMethodError(  # noqa: B904
+                f"unexpected 'git log' output: '{log_out}'"
+            )
+        # %D lists "HEAD -> <branch>" when on a branch; a detached HEAD shows
+        # plain "HEAD". Scan the list instead of assuming HEAD comes first
+        # ("grafted" can precede it in shallow clones).
+        branch_name = "HEAD"
+        for ref in decorations.split(", "):
+            if ref.startswith("HEAD -> "):
+                branch_name = ref[len("HEAD -> ") :]
+                break
 
         # if there is a tag matching tag_prefix, this yields TAG-NUM-gHEX[-dirty]
         # if there isn't one, this yields HEX[-dirty] (no NUM)
@@ -378,8 +445,12 @@ class GitPieces:
                 "--dirty",
                 "--always",
                 "--long",
+                # NOTE: [0-9] is a plain fnmatch range, which every git build
+                # handles on the fast glob path; POSIX classes like
+                # [[:digit:]] are slower or unsupported on some older builds.
+                # With tag_prefix="" this matches any tag starting with a digit.
                 "--match",
-                f"{tag_prefix}[[:digit:]]*",
+                f"{tag_prefix}[0-9]*",
             ],
             cwd=cwd,
         )
@@ -387,51 +458,18 @@ class GitPieces:
         if describe_out is None:
             raise NotThisMethodError("'git describe' failed")
         describe_out = describe_out.strip()
-        full_out, rc = runner(GIT_COMMANDS, ["rev-parse", "HEAD"], cwd=cwd)
-        if full_out is None:
-            raise NotThisMethodError("'git rev-parse' failed")
-        full_out = full_out.strip()
 
         pieces: dict[str, Any] = {}
         pieces["long"] = full_out
         pieces["short"] = full_out[:7]  # maybe improved later
         pieces["error"] = None
 
-        branch_name, rc = runner(
-            GIT_COMMANDS, ["rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd
-        )
-        # --abbrev-ref was added in git-1.6.3
-        if rc != 0 or branch_name is None:
-            raise NotThisMethodError("'git rev-parse --abbrev-ref' returned error")
-        branch_name = branch_name.strip()
-
-        if branch_name == "HEAD":
-            # If we aren't exactly on a branch, pick a branch which represents
-            # the current commit. If all else fails, we are on a branchless
-            # commit.
-            branches, rc = runner(GIT_COMMANDS, ["branch", "--contains"], cwd=cwd)
-            # --contains was added in git-1.5.4
-            if rc != 0 or branches is None:
-                raise NotThisMethodError("'git branch --contains' returned error")
-            branches = branches.split("\n")
-
-            # Remove the first line if we're running detached
-            if "(" in branches[0]:
-                branches.pop(0)
-
-            # Strip off the leading "* " from the list of branches.
-            branches = [branch.lstrip("* ") for branch in branches]
-            if not branches:
-                branch_name = None
-            else:
-                for master_branch_name in MASTER_BRANCHES:
-                    if master_branch_name in branches:
-                        branch_name = master_branch_name
-                        break
-                else:
-                    # Pick the first branch that is returned. Good or bad.
-                    branch_name = branches[0]
-
+        # A detached HEAD ("HEAD") is resolved lazily in _resolve_branch(),
+        # since only the branch-aware render styles look at the branch name.
+        # NOTE: `symbolic-ref --quiet --short HEAD` would signal detachment via
+        # its exit code instead of the "HEAD" sentinel, but it can't be batched
+        # into the single `git log` spawn above, so it would cost one more
+        # process per resolution.
         pieces["branch"] = branch_name
 
         # parse describe_out. It will be like TAG-NUM-gHEX[-dirty] or HEX[-dirty]
@@ -442,14 +480,31 @@ class GitPieces:
         dirty = git_describe.endswith("-dirty")
         pieces["dirty"] = dirty
         if dirty:
-            git_describe = git_describe[: git_describe.rindex("-dirty")]
+            # endswith already proved the suffix; slice it off without the
+            # redundant rindex scan.
+            git_describe = git_describe[: -len("-dirty")]
 
         # now we have TAG-NUM-gHEX or HEX
 
         if "-" in git_describe:
-            # TAG-NUM-gHEX
-            mo = re.search(r"^(.+)-(\d+)-g([0-9a-f]+)$", git_describe)
-            if not mo:
+            # TAG-NUM-gHEX: with --long, the last two dash-separated fields are
+            # guaranteed to be the distance and the g-prefixed hash, so a
+            # single rsplit parses it (tags with embedded dashes stay intact
+            # in the first field, as with the previous greedy regex).
+            parts = git_describe.rsplit("-", 2)
+            try:
+                distance = int(parts[1])
+                ghex = parts[2][1:]
+                int(ghex, 16)  # validate hex
+            except (IndexError, ValueError):
+                # Bind both so they dominate their uses below; the parsable
+                # guard returns before either bogus value can be read.
+                distance = 0
+                ghex = ""
+                parsable = False
+            else:
+                parsable = len(parts) == 3 and parts[2].startswith("g") and bool(ghex)
+            if not parsable:
                 # unparsable. Maybe git-describe is misbehaving?
                 pieces["error"] = (
                     f"unable to parse git-describe output: '{describe_out}'"
@@ -457,7 +512,7 @@ class GitPieces:
                 return cls(**pieces, cwd=cwd, verbose=verbose)
 
             # tag
-            full_tag = mo.group(1)
+            full_tag = parts[0]
             if not full_tag.startswith(tag_prefix):
                 if verbose:
                     print(f"tag '{full_tag}' doesn't start with prefix '{tag_prefix}'")
@@ -469,11 +524,11 @@ class GitPieces:
             pieces["closest_tag"] = full_tag[len(tag_prefix) :]
 
             # distance: number of commits since tag
-            pieces["distance"] = int(mo.group(2))
+            pieces["distance"] = distance
 
             # Normalize to 7 hex chars (excluding the leading "g") for stable
             # rendering across clones/CI.
-            pieces["short"] = mo.group(3)[:7]
+            pieces["short"] = ghex[:7]
 
         else:
             # HEX: no tags
@@ -485,17 +540,48 @@ class GitPieces:
             assert out is not None
             pieces["distance"] = len(out.split())  # total number of commits
 
-        # commit date: see ISO-8601 comment in git_versions_from_keywords()
-        out, rc = runner(GIT_COMMANDS, ["show", "-s", "--format=%ci", "HEAD"], cwd=cwd)
-        assert out is not None
-        date = out.strip()
-        # Use only the last line.  Previous lines may contain GPG signature
-        # information.
-        date = date.splitlines()[-1]
-        pieces["date"] = date.strip().replace(" ", "T", 1).replace(" ", "", 1)
+        # commit date: see ISO-8601 comment in git_versions_from_keywords().
+        # Already fetched by the batched `git log` spawn above.
+        pieces["date"] = _iso8601ify(date.strip())
 
         return cls(**pieces, cwd=cwd, verbose=verbose)
 
+    def _resolve_branch(self) -> "str | None":
+        """
+        If we aren't exactly on a branch, pick a branch which represents the
+        current commit. If all else fails, we are on a branchless commit.
+
+        Only the branch-aware render styles need the branch name, so the extra
+        `git branch --contains` spawn is deferred until one of them asks.
+        """
+        if self.branch != "HEAD":
+            return self.branch
+
+        runner = functools.partial(_run_command, env=_git_env(), verbose=self.verbose)
+        # The listing can be large on repos with many branches; parse it as
+        # bytes and decode only the single name we end up selecting.
+        out, rc = runner(
+            GIT_COMMANDS, ["branch", "--contains"], cwd=self.cwd, binary=True
+        )
+        # --contains was added in git-1.5.4
+        if rc != 0 or out is None:
+            raise NotThisMethodError("'git branch --contains' returned error")
+        branches = out.split(b"\n")
+
+        # Remove the first line if we're running detached
+        if b"(" in branches[0]:
+            branches.pop(0)
+
+        # Strip off the leading "* " from the list of branches.
+        branches = [branch.lstrip(b"* ") for branch in branches]
+        if not branches:
+            return None
+        for master_branch_name in MASTER_BRANCHES:
+            if master_branch_name.encode("ascii") in branches:
+                return master_branch_name
+        # Pick the first branch that is returned. Good or bad.
+        return branches[0].decode("utf-8")
+
     @property
     def _plus_or_dot(self) -> str:
         """Return a + if we don't already have one, else return a ."""
@@ -515,19 +601,16 @@ class GitPieces:
         Exceptions:
         1: no tags. git_describe was just HEX. 0+untagged.DISTANCE.gHEX[.dirty]
         """
+        dirty = ".dirty" if self.dirty else ""
         if self.closest_tag:
-            rendered = self.closest_tag
-            if self.distance or self.dirty:
-                rendered += self._plus_or_dot
-                rendered += f"{self.distance}.g{self.short}"
-                if self.dirty:
-                    rendered += ".dirty"
-        else:
-            # exception #1
-            rendered = f"0+untagged.{self.distance}.g{self.short}"
-            if self.dirty:
-                rendered += ".dirty"
-        return rendered
+            if not (self.distance or self.dirty):
+                return self.closest_tag
+            plus_or_dot = self._plus_or_dot
+            return (
+                f"{self.closest_tag}{plus_or_dot}{self.distance}.g{self.short}{dirty}"
+            )
+        # exception #1
+        return f"0+untagged.{self.distance}.g{self.short}{dirty}"
 
     def _render_pep440_master(self) -> str:
         """
@@ -561,22 +644,18 @@ class GitPieces:
             return self.closest_tag or "0+untagged"
 
         if self.closest_tag:
-            rendered = self.closest_tag
-            rendered += self._plus_or_dot
+            head = self.closest_tag + self._plus_or_dot
         else:
             # exception #1
-            rendered = "0+untagged."
+            head = "0+untagged."
 
-        rendered += (
+        dirty = ".dirty" if self.dirty else ""
+        return (
+            f"{head}"
             f"{master_info.distance_from_tag_to_master}.g{master_info.master_commit_short}"
-            f".{master_info.distance_from_master}.g{self.short}"
+            f".{master_info.distance_from_master}.g{self.short}{dirty}"
         )
 
-        if self.dirty:
-            rendered += ".dirty"
-
-        return rendered
-
     def _render_pep440_branch(self) -> str:
         """
         TAG[[.dev0]+DISTANCE.gHEX[.dirty]] .
@@ -587,24 +666,18 @@ class GitPieces:
         Exceptions:
             1: no tags. 0[.dev0]+untagged.DISTANCE.gHEX[.dirty]
         """
+        dev0 = ".dev0" if self._resolve_branch() not in MASTER_BRANCHES else ""
+        dirty = ".dirty" if self.dirty else ""
         if self.closest_tag:
-            rendered = self.closest_tag
-            if self.distance or self.dirty:
-                if self.branch not in MASTER_BRANCHES:
-                    rendered += ".dev0"
-                rendered += self._plus_or_dot
-                rendered += f"{self.distance}.g{self.short}"
-                if self.dirty:
-                    rendered += ".dirty"
-        else:
-            # exception #1
-            rendered = "0"
-            if self.branch not in MASTER_BRANCHES:
-                rendered += ".dev0"
-            rendered += f"+untagged.{self.distance}.g{self.short}"
-            if self.dirty:
-                rendered += ".dirty"
-        return rendered
+            if not (self.distance or self.dirty):
+                return self.closest_tag
+            plus_or_dot = self._plus_or_dot
+            return (
+                f"{self.closest_tag}{dev0}{plus_or_dot}"
+                f"{self.distance}.g{self.short}{dirty}"
+            )
+        # exception #1
+        return f"0{dev0}+untagged.{self.distance}.g{self.short}{dirty}"
 
     @staticmethod
     def _pep440_split_post(ver: str) -> "tuple[str, int | None]":
@@ -614,8 +687,11 @@ class GitPieces:
         Returns the release segments before the post-release and the
         post-release version number (or -1 if no post-release segment is present).
         """
-        vc = str.split(ver, ".post")
-        return vc[0], int(vc[1] or 0) if len(vc) == 2 else None
+        # rpartition scans once from the right and never allocates a list.
+        head, sep, tail = ver.rpartition(".post")
+        if not sep:
+            return ver, None
+        return head, int(tail or 0)
 
     def _render_pep440_pre(self) -> str:
         """
@@ -628,18 +704,11 @@ class GitPieces:
             if self.distance:
                 # update the post release segment
                 tag_version, post_version = self._pep440_split_post(self.closest_tag)
-                rendered = tag_version
-                if post_version is not None:
-                    rendered += f".post{post_version}.dev{self.distance}"
-                else:
-                    rendered += f".post0.dev{self.distance}"
-            else:
-                # no commits, use the tag as the version
-                rendered = self.closest_tag
-        else:
-            # exception #1
-            rendered = f"0.post0.dev{self.distance}"
-        return rendered
+                return f"{tag_version}.post{post_version or 0}.dev{self.distance}"
+            # no commits, use the tag as the version
+            return self.closest_tag
+        # exception #1
+        return f"0.post0.dev{self.distance}"
 
     def _render_pep440_post(self) -> str:
         """
@@ -657,21 +726,14 @@ class GitPieces:
         Exceptions:
             When no tags: 0.postDISTANCE+gHEX[.dirty]
         """
+        dirty = ".dirty" if self.dirty else ""
         if self.closest_tag:
-            rendered = self.closest_tag
-            if self.distance or self.dirty:
-                rendered += f".post{self.distance}"
-                rendered += self._plus_or_dot
-                rendered += f"g{self.short}"
-                if self.dirty:
-                    rendered += ".dirty"
-        else:
-            # exception
-            rendered = f"0.post{self.distance}"
-            rendered += f"+g{self.short}"
-            if self.dirty:
-                rendered += ".dirty"
-        return rendered
+            if not (self.distance or self.dirty):
+                return self.closest_tag
+            plus_or_dot = self._plus_or_dot
+            return f"{self.closest_tag}.post{self.distance}{plus_or_dot}g{self.short}{dirty}"
+        # exception
+        return f"0.post{self.distance}+g{self.short}{dirty}"
 
     def _render_pep440_post_branch(self) -> str:
         """
@@ -682,25 +744,18 @@ class GitPieces:
         Exceptions:
         1: no tags. 0.postDISTANCE[.dev0]+gHEX[.dirty]
         """
+        dev0 = ".dev0" if self._resolve_branch() not in MASTER_BRANCHES else ""
+        dirty = ".dirty" if self.dirty else ""
         if self.closest_tag:
-            rendered = self.closest_tag
-            if self.distance or self.dirty:
-                rendered += f".post{self.distance}"
-                if self.branch not in MASTER_BRANCHES:
-                    rendered += ".dev0"
-                rendered += self._plus_or_dot
-                rendered += f"g{self.short}"
-                if self.dirty:
-                    rendered += ".dirty"
-        else:
-            # exception #1
-            rendered = f"0.post{self.distance}"
-            if self.branch not in MASTER_BRANCHES:
-                rendered += ".dev0"
-            rendered += f"+g{self.short}"
-            if self.dirty:
-                rendered += ".dirty"
-        return rendered
+            if not (self.distance or self.dirty):
+                return self.closest_tag
+            plus_or_dot = self._plus_or_dot
+            return (
+                f"{self.closest_tag}.post{self.distance}{dev0}{plus_or_dot}"
+                f"g{self.short}{dirty}"
+            )
+        # exception #1
+        return f"0.post{self.distance}{dev0}+g{self.short}{dirty}"
 
     def _render_git_describe(self) -> str:
         """
@@ -711,16 +766,13 @@ class GitPieces:
         Exceptions:
         1: no tags. HEX[-dirty]  (note: no 'g' prefix)
         """
+        dirty = "-dirty" if self.dirty else ""
         if self.closest_tag:
-            rendered = self.closest_tag
             if self.distance:
-                rendered += f"-{self.distance}-g{self.short}"
-        else:
-            # exception #1
-            rendered = self.short
-        if self.dirty:
-            rendered += "-dirty"
-        return rendered
+                return f"{self.closest_tag}-{self.distance}-g{self.short}{dirty}"
+            return f"{self.closest_tag}{dirty}"
+        # exception #1
+        return f"{self.short}{dirty}"
 
     def _render_git_describe_long(self) -> str:
         """
@@ -732,15 +784,11 @@ class GitPieces:
         Exceptions:
         1: no tags. HEX[-dirty]  (note: no 'g' prefix)
         """
+        dirty = "-dirty" if self.dirty else ""
         if self.closest_tag:
-            rendered = self.closest_tag
-            rendered += f"-{self.distance}-g{self.short}"
-        else:
-            # exception #1
-            rendered = self.short
-        if self.dirty:
-            rendered += "-dirty"
-        return rendered
+            return f"{self.closest_tag}-{self.distance}-g{self.short}{dirty}"
+        # exception #1
+        return f"{self.short}{dirty}"
 
     def _render_digits(self) -> str:
         """
@@ -815,6 +863,46 @@ class GitPieces:
         }
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_command(command: str) -> "str | None":
+    """
+    Resolve a command name to an absolute path, once per process.
+
+    Spawning with a bare name makes the kernel scan PATH on every call
+    (and raise ENOENT per missing candidate); shutil.which does the scan
+    once in userspace and the result is memoised.
+    """
+    return shutil.which(command)
+
+
+# Overloads keyed on `binary` keep text-mode callers typed as str:
+# only binary=True widens stdout to bytes.
+@overload
+def _run_command(
+    commands: "list[str]",
+    args: "list[str | PathLike]",
+    *,
+    cwd: "str | PathLike | None" = None,
+    hide_stderr: bool = False,
+    env: "dict[str, str] | None" = None,
+    verbose: bool = False,
+    binary: "Literal[False]" = False,
+) -> "tuple[str | None, int | None]": ...
+
+
+@overload
+def _run_command(
+    commands: "list[str]",
+    args: "list[str | PathLike]",
+    *,
+    cwd: "str | PathLike | None" = None,
+    hide_stderr: bool = False,
+    env: "dict[str, str] | None" = None,
+    verbose: bool = False,
+    binary: "Literal[True]",
+) -> "tuple[bytes | None, int | None]": ...
+
+
 def _run_command(
     commands: "list[str]",
     args: "list[str | PathLike]",
@@ -823,29 +911,44 @@ def _run_command(
     hide_stderr: bool = False,
     env: "dict[str, str] | None" = None,
     verbose: bool = False,
-) -> "tuple[str | None, int | None]":
-    """Call the given command(s)."""
+    binary: bool = False,
+) -> "tuple[str | bytes | None, int | None]":
+    """
+    Call the given command(s).
+
+    With binary=True, stdout is returned as undecoded bytes; useful when the
+    output is large (e.g. a branch listing) and only a fragment is needed.
+    """
     assert isinstance(commands, list)
-    process = None
 
-    popen_kwargs: dict[str, Any] = {}
+    run_kwargs: dict[str, Any] = {}
     if sys.platform == "win32":
         # This hides the console window if pythonw.exe is used
         startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        popen_kwargs["startupinfo"] = startupinfo
+        run_kwargs["startupinfo"] = startupinfo
 
     for command in commands:
         dispcmd = str([command, *args])
+        executable = _resolve_command(command)
+        if executable is None:
+            continue
         try:
             # remember shell=False, so use git.cmd on windows, not just git
-            process = subprocess.Popen(
-                [command, *args],
+            # NOTE: subprocess.run with default close_fds and a str-only env
+            # takes CPython's posix_spawn fast path on Linux, which is much
+            # cheaper than fork+exec when the parent process is large.
+            process = subprocess.run(
+                [executable, *args],
                 cwd=cwd,
                 env=env,
                 stdout=subprocess.PIPE,
-                stderr=(subprocess.PIPE if hide_stderr else None),
-                **popen_kwargs,
+                # DEVNULL lets the kernel discard hidden stderr without
+                # allocating a pipe pair that nothing ever reads.
+                stderr=(subprocess.DEVNULL if hide_stderr else None),
+                encoding=(None if binary else "utf-8"),
+                check=False,
+                **run_kwargs,
             )
             break
         except OSError as e:
@@ -859,7 +962,7 @@ def _run_command(
         if verbose:
             print(f"unable to find command, tried {commands}")
         return None, None
-    stdout = process.communicate()[0].strip().decode()
+    stdout = process.stdout.strip()
     if process.returncode != 0:
         if verbose:
             print(f"unable to run {dispcmd} (error)")
@@ -876,6 +979,8 @@ def _run_git_command_or_error(
     verbose: bool = False,
 ):
     """Run a git command or raise an error."""
+    if env is None:
+        env = _git_env()
     out, rc = _run_command(
         GIT_COMMANDS, args, cwd=cwd, hide_stderr=not verbose, env=env, verbose=verbose
     )
@@ -891,17 +996,20 @@ def _find_root_dir_with_file(
     """
     Find the first parent directory containing a specific "marker", relative to a file path.
     """
-    source = Path(source).resolve()
     if isinstance(marker, str):
         marker = {marker}
 
-    while source != source.parent:
-        if any((source / m).exists() for m in marker):
-            return source
-
-        source = source.parent
+    # Walk with os.path string operations: constructing a Path object per
+    # level/marker is the dominant cost of this loop.
+    directory = os.path.realpath(source)
+    while True:
+        if any(os.path.exists(os.path.join(directory, m)) for m in marker):  # noqa: PTH110, PTH118
+            return Path(directory)
 
-    raise FileNotFoundError(f"File {marker} not found in any parent directory")
+        parent = os.path.dirname(directory)  # noqa: PTH120
+        if parent == directory:
+            raise FileNotFoundError(f"File {marker} not found in any parent directory")
+        directory = parent
 
 
 def get_version_from_parentdir(
@@ -934,7 +1042,7 @@ def get_version_from_parentdir(
             dirname = project_root.name
             if dirname.startswith(parentdir_prefix):
                 version_candidate = dirname[len(parentdir_prefix) :]
-                if re.match(_VERSION_PATTERN, version_candidate, re.VERBOSE):
+                if _VERSION_RE.match(version_candidate):
                     return {
                         "version": version_candidate,
                         "full_revisionid": None,
@@ -1112,6 +1220,12 @@ def get_version_dict_with_all_methods(
 ) -> VersionDict:
     """
     Get version information from PKG-INFO, Git tags or parent directory as a fallback.
+
+    Note:
+        Versioneer's `$Format:...$` keyword-expansion method (and its dict
+        allocation per call) was dropped in Version-Pioneer; sdists carry
+        PKG-INFO instead, which is checked first and is cheaper than any
+        git spawn.
     """
     if cfg is None:
         cfg = VersionPioneerConfig()
@@ -1148,6 +1262,10 @@ def get_version_dict_with_all_methods(
 
 
 # IMPORTANT: However you customise the file, make sure the following function is defined!
+# NOTE: lru_cache so long-lived processes that read the version repeatedly only
+# pay the git-subprocess cost once. The cache lives in this module, so build
+# backends that re-exec the script still observe fresh git state.
+@functools.lru_cache(maxsize=1)
 def get_version_dict() -> VersionDict:
     return get_version_dict_with_all_methods()
 
@@ -30,6 +30,23 @@ def test_build_consistency(new_hatchling_project: Path):
     build_consistency_test(project_dir=new_hatchling_project, expected_version="0.1.0")
 
 
+def test_build_consistency_fast_mode(new_hatchling_project: Path):
+    # Reset the project to a known state.
+    subprocess.run(["git", "stash", "--all"], cwd=new_hatchling_project, check=True)
+    subprocess.run(["git", "checkout", "v0.1.0"], cwd=new_hatchling_project, check=True)
+
+    build_consistency_test(
+        project_dir=new_hatchling_project, expected_version="0.1.0", fast_mode=True
+    )
+
+
+def test_fast_mode_requires_chaining(new_hatchling_project: Path):
+    with pytest.raises(ValueError, match="fast_mode requires test_chaining"):
+        build_consistency_test(
+            project_dir=new_hatchling_project, test_chaining=False, fast_mode=True
+        )
+
+
 def test_build_version(new_hatchling_project: Path):
     # Reset the project to a known state.
     subprocess.run(["git", "stash", "--all"], cwd=new_hatchling_project, check=True)